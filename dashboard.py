@@ -1,3 +1,4 @@
+import logging
 import sys
 import numpy as np
 
@@ -12,17 +13,152 @@ from PyQt5.QtWidgets import (
     QTableWidget,
     QTableWidgetItem,
     QGroupBox,
-    QTextEdit,
+    QPlainTextEdit,
 )
+import matplotlib
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
 from matplotlib.collections import LineCollection
 from matplotlib.colors import Normalize
-import matplotlib.cm as cm
+
+# Child of the app's "telemetry" logger, so F1_LOG applies here too
+log = logging.getLogger("telemetry.dashboard")
+
+
+# ------------------ Real-time Lap Buffer ------------------ #
+
+# Channels buffered for the lap currently being driven (sample field -> dtype).
+# float32 is plenty for sim telemetry; gear/RPM are whole numbers.
+REALTIME_CHANNELS = {
+    "t": np.float32,
+    "x": np.float32,
+    "z": np.float32,
+    "speed": np.float32,
+    "gear": np.int8,
+    "rpms": np.uint16,
+    "brake": np.float32,
+    "tyre_pressure_fl": np.float32,
+    "tyre_pressure_fr": np.float32,
+    "tyre_pressure_rl": np.float32,
+    "tyre_pressure_rr": np.float32,
+    "tyre_temp_fl": np.float32,
+    "tyre_temp_fr": np.float32,
+    "tyre_temp_rl": np.float32,
+    "tyre_temp_rr": np.float32,
+}
+
+_VALUE_CHANNELS = tuple(name for name in REALTIME_CHANNELS if name != "t")
+
+
+class RealtimeLapBuffer:
+    """
+    Struct-of-arrays buffer for the lap currently being driven.
+
+    Every channel is a preallocated NumPy array written at index `n`, so the
+    plotting code can take zero-copy views (`view("speed")`) instead of
+    rebuilding arrays from a list of dicts on every redraw.
+    Times are stored relative to the first sample of the lap.
+    """
+
+    def __init__(self, capacity: int = 8192):
+        self.capacity = capacity
+        self.n = 0
+        self._t0 = 0.0
+        self.channels = {
+            name: np.empty(capacity, dtype=dtype) for name, dtype in REALTIME_CHANNELS.items()
+        }
+        # Running (min, max) per channel for the current lap, kept up to date
+        # by extend() so redraws never need to scan the whole lap
+        self._extent = {}
+
+    def reset(self):
+        """Start a new lap (keeps the allocated storage)."""
+        self.n = 0
+        self._extent = {}
+
+    def extend(self, samples: np.ndarray):
+        """Append a SAMPLE_DTYPE array (see telemetry/samples.py) with one copy per channel."""
+        n = self.n
+        k = len(samples)
+        while n + k > self.capacity:
+            self._grow()
+        if n == 0:
+            self._t0 = samples["t"][0]
+
+        end = n + k
+        channels = self.channels
+        extent = self._extent
+        channels["t"][n:end] = samples["t"] - self._t0  # relative, so float32 keeps ms precision
+        for name in _VALUE_CHANNELS:
+            values = samples[name]
+            channels[name][n:end] = values
+            lo, hi = float(values.min()), float(values.max())
+            if n:
+                prev_lo, prev_hi = extent[name]
+                lo, hi = min(lo, prev_lo), max(hi, prev_hi)
+            extent[name] = (lo, hi)
+        self.n = end
+
+    def extent(self, *names: str) -> tuple:
+        """(min, max) over the current lap for one or more channels (not "t")."""
+        extent = self._extent
+        return (
+            min(extent[name][0] for name in names),
+            max(extent[name][1] for name in names),
+        )
+
+    def view(self, name: str, index=None) -> np.ndarray:
+        """
+        Zero-copy view of the filled part of a channel, optionally
+        subsampled with `index` (see `downsample_index`).
+        """
+        data = self.channels[name][:self.n]
+        return data if index is None else data[index]
+
+    def _grow(self):
+        self.capacity *= 2
+        for name, arr in self.channels.items():
+            grown = np.empty(self.capacity, dtype=arr.dtype)
+            grown[:self.n] = arr[:self.n]
+            self.channels[name] = grown
+
+
+def downsample_index(n: int, target: int):
+    """
+    Index selecting at most `target` evenly spaced samples out of `n`
+    (first and last always kept), or None when no downsampling is needed.
+    """
+    if n <= target:
+        return None
+    return np.linspace(0, n - 1, target).astype(np.intp)
 
 
 # ------------------ Generic Matplotlib Canvas for Time Series ------------------ #
 
+def update_axis_limits(ax, t_end: float, y_min: float, y_max: float) -> bool:
+    """
+    Move the axes limits only when the data leaves them (or shrinks to well
+    under half of them), with some headroom so this stays rare. Works from
+    the data extent alone, so no relim()/autoscale_view() scan is needed.
+    Returns True if the limits changed.
+    """
+    changed = False
+
+    x_hi = ax.get_xlim()[1]
+    new_x_hi = max(t_end * 1.25, 10.0)
+    if t_end > x_hi or new_x_hi < 0.5 * x_hi:
+        ax.set_xlim(0, new_x_hi)
+        changed = True
+
+    y_lo, y_hi = ax.get_ylim()
+    margin = 0.05 * (y_max - y_min) or 1.0
+    if y_min < y_lo or y_max > y_hi or (y_max - y_min + 2 * margin) < 0.5 * (y_hi - y_lo):
+        ax.set_ylim(y_min - margin, y_max + margin)
+        changed = True
+
+    return changed
+
+
 class TimeSeriesCanvas(FigureCanvas):
     def __init__(self, title: str, parent=None, width=4, height=1.5, dpi=100):
         self.fig = Figure(figsize=(width, height), dpi=dpi)
@@ -48,20 +184,41 @@ class TimeSeriesCanvas(FigureCanvas):
         self.ax.grid(True, color="#333333", alpha=0.6)
         self.ax.set_xlabel("Time [s]", fontsize=7)
 
-        self.line, = self.ax.plot([], [], linewidth=1.5, color="#6FA8FF")
+        # The line is animated: full redraws only paint the static background,
+        # and the line itself is blitted on top of the cached background
+        self.line, = self.ax.plot([], [], linewidth=1.5, color="#6FA8FF", animated=True)
+        self.ax.set_xlim(0, 10)
+
+        self._background = None
+        self.mpl_connect("draw_event", self._on_draw)
 
         self.fig.tight_layout(pad=0.5)
+        self.fig.set_layout_engine("none")  # lay out once; redraws never re-run layout
+
+    def _on_draw(self, event):
+        """Snapshot the background after a full redraw and put the line back on top."""
+        self._background = self.copy_from_bbox(self.ax.bbox)
+        self.ax.draw_artist(self.line)
 
-    def update_data(self, t: np.ndarray, y: np.ndarray):
+    def update_data(self, t: np.ndarray, y: np.ndarray, y_range: tuple = None):
         """
-        Update the line data and rescale axes.
+        Update the line data. Blits just the line when the axes limits are
+        unchanged; otherwise schedules a full (coalesced) redraw.
+        y_range: (min, max) of y if already known, to skip scanning y.
         """
         if t.size == 0 or y.size == 0:
             return
         self.line.set_data(t, y)
-        self.ax.relim()
-        self.ax.autoscale_view()
-        self.draw()
+
+        y_min, y_max = y_range if y_range is not None else (float(y.min()), float(y.max()))
+        if update_axis_limits(self.ax, float(t[-1]), y_min, y_max) or self._background is None:
+            self._background = None  # refreshed by the next draw_event
+            self.draw_idle()
+            return
+
+        self.restore_region(self._background)
+        self.ax.draw_artist(self.line)
+        self.blit(self.ax.bbox)
 
 
 # ------------------ Multi-Line Time Series (for Tires) ------------------ #
@@ -100,11 +257,13 @@ class MultiLineCanvas(FigureCanvas):
 
         self.ax.legend(loc="upper right", fontsize=6, framealpha=0.8)
         self.fig.tight_layout(pad=0.5)
+        self.fig.set_layout_engine("none")  # lay out once; redraws never re-run layout
 
-    def update_data(self, t: np.ndarray, y_data: list):
+    def update_data(self, t: np.ndarray, y_data: list, y_range: tuple = None):
         """
         Update multiple lines.
         y_data: list of numpy arrays, one for each line
+        y_range: (min, max) over all lines if already known, to skip scanning them.
         """
         if t.size == 0:
             return
@@ -113,13 +272,31 @@ class MultiLineCanvas(FigureCanvas):
             if y.size > 0:
                 line.set_data(t, y)
 
-        self.ax.relim()
-        self.ax.autoscale_view()
-        self.draw()
+        if y_range is None:
+            y_range = (min(float(y.min()) for y in y_data), max(float(y.max()) for y in y_data))
+        update_axis_limits(self.ax, float(t[-1]), *y_range)
+        self.draw_idle()
 
 
 # ------------------ Track Map Canvas ------------------ #
 
+def build_segments(xs: np.ndarray, zs: np.ndarray, out: np.ndarray) -> np.ndarray:
+    """
+    Fill `out` (shape (N-1, 2, 2)) with consecutive point pairs
+    [[x0, z0], [x1, z1]] for a LineCollection, and return it.
+    Works on plain arrays only, so callers can reuse `out` between frames.
+    """
+    out[:, 0, 0] = xs[:-1]
+    out[:, 0, 1] = zs[:-1]
+    out[:, 1, 0] = xs[1:]
+    out[:, 1, 1] = zs[1:]
+    return out
+
+
+# Colormap for the speed-colored track; looked up once, not per redraw
+_CMAP_BLUES = matplotlib.colormaps["Blues"]
+
+
 class TrackMapCanvas(FigureCanvas):
     def __init__(self, parent=None, width=4, height=4, dpi=100):
         self.fig = Figure(figsize=(width, height), dpi=dpi)
@@ -143,87 +320,73 @@ class TrackMapCanvas(FigureCanvas):
         self.ax.title.set_color("#FFFFFF")
 
         # General style
-        self.ax.set_aspect("equal", adjustable="datalim")
+        self.ax.set_aspect("equal", adjustable="box")  # fixed limits below; the box shrinks to keep 1:1
         self.ax.set_title("Location Map", fontsize=10)
         self.ax.set_xlabel("X [m]", fontsize=8)
         self.ax.set_ylabel("Z [m]", fontsize=8)
         self.ax.grid(True, color="#333333", alpha=0.6)
 
-        self.line_collection = None
-        self.colorbar = None
+        # Speed-colored path: created once, then updated in place every frame
+        self._norm = Normalize(0, 1)
+        self.line_collection = LineCollection([], cmap=_CMAP_BLUES, norm=self._norm, linewidth=2.5)
+        self.ax.add_collection(self.line_collection)
+        self.colorbar = self.fig.colorbar(
+            self.line_collection, ax=self.ax, fraction=0.046, pad=0.04, label="Speed [km/h]"
+        )
+        self._bounds = None
+        self._seg_buf = None  # grow-only scratch for build_segments
 
         self.fig.tight_layout(pad=1.0)
+        self.fig.set_layout_engine("none")  # lay out once; redraws never re-run layout
 
-    def plot_track(self, xs: np.ndarray, zs: np.ndarray, speeds: np.ndarray):
+    def plot_track(self, xs: np.ndarray, zs: np.ndarray, speeds: np.ndarray,
+                   x_range: tuple = None, z_range: tuple = None, speed_range: tuple = None):
         """
         Plot the track as a series of line segments colored by speed.
         xs, zs, speeds: 1D numpy arrays of same length.
+        x_range, z_range, speed_range: (min, max) if already known, to skip scanning the arrays.
+
+        Reuses the existing LineCollection (set_segments/set_array) instead of
+        rebuilding it and the colorbar on every frame.
         """
-        try:
-            # Remove old line collection if it exists
-            if self.line_collection is not None:
-                try:
-                    self.line_collection.remove()
-                except:
-                    pass
-
-            # Clear axis only if needed (for style reset)
-            if not hasattr(self, '_initialized'):
-                self.ax.clear()
-                self.ax.set_aspect("equal", adjustable="datalim")
-                self.ax.set_title("Location Map", fontsize=10)
-                self.ax.set_xlabel("X [m]", fontsize=8)
-                self.ax.set_ylabel("Z [m]", fontsize=8)
-                self.ax.grid(True, color="#333333", alpha=0.6)
-                self._initialized = True
-
-            if xs.size < 2:
-                self.draw_idle()
-                return
-
-            points = np.array([xs, zs]).T.reshape(-1, 1, 2)
-            segments = np.concatenate([points[:-1], points[1:]], axis=1)
-
-            norm = Normalize(vmin=np.min(speeds), vmax=np.max(speeds))
-            cmap = cm.get_cmap("Blues")
-
-            lc = LineCollection(
-                segments,
-                cmap=cmap,
-                norm=norm,
-                linewidth=2.5,
-            )
-            lc.set_array(speeds[:-1])
-
-            self.line_collection = lc
-            self.ax.add_collection(lc)
-
-            self.ax.set_xlim(xs.min() - 10, xs.max() + 10)
-            self.ax.set_ylim(zs.min() - 10, zs.max() + 10)
-
-            # Only create colorbar once
-            if self.colorbar is None:
-                try:
-                    self.colorbar = self.fig.colorbar(
-                        lc, ax=self.ax, fraction=0.046, pad=0.04, label="Speed [km/h]"
-                    )
-                except:
-                    pass  # Skip colorbar if it fails
-            else:
-                # Update existing colorbar
-                try:
-                    self.colorbar.update_normal(lc)
-                except:
-                    pass  # Skip if update fails
-
-            self.draw_idle()  # Use draw_idle instead of draw for better performance
-        except Exception as e:
-            # Silently fail to avoid crashing the UI
-            pass
+        lc = self.line_collection
+
+        if xs.size < 2:
+            lc.set_segments([])
+            self.draw_idle()
+            return
+
+        n_seg = xs.size - 1
+        buf = self._seg_buf
+        if buf is None or buf.shape[0] < n_seg or buf.dtype != xs.dtype:
+            size = max(n_seg, 2 * buf.shape[0] if buf is not None else 1024)
+            buf = self._seg_buf = np.empty((size, 2, 2), dtype=xs.dtype)
+        segments = build_segments(xs, zs, buf[:n_seg])
+
+        x_min, x_max = x_range if x_range is not None else (xs.min(), xs.max())
+        z_min, z_max = z_range if z_range is not None else (zs.min(), zs.max())
+        s_min, s_max = speed_range if speed_range is not None else (speeds.min(), speeds.max())
+
+        lc.set_segments(segments)
+        lc.set_array(speeds[:-1])
+        if (s_min, s_max) != (self._norm.vmin, self._norm.vmax):
+            lc.set_clim(s_min, s_max)  # updates self._norm in place; colorbar follows
+
+        bounds = (x_min - 10, x_max + 10, z_min - 10, z_max + 10)
+        if bounds != self._bounds:
+            self.ax.set_xlim(bounds[0], bounds[1])
+            self.ax.set_ylim(bounds[2], bounds[3])
+            self._bounds = bounds
+
+        self.draw_idle()
 
 
 # ------------------ Main Dashboard Window ------------------ #
 
+# Transcript panes keep only the most recent lines (oldest drop off)
+TRANSCRIPT_MAX_LINES = 500
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -232,8 +395,20 @@ class MainWindow(QMainWindow):
         self.resize(1600, 900)
 
         # Real-time data buffers for current lap
-        self.current_lap_samples = []
+        self.lap_trace = RealtimeLapBuffer()
         self.current_lap_id = None
+        self._last_drawn_n = 0
+        self._brake_buf = np.empty(1024, dtype=np.float32)  # grow-only scratch for brake %
+        self._realtime_ring = None  # telemetry.samples.SampleRing, see set_realtime_source
+
+        # Last text set on each live-data label
+        self._label_text = {}
+
+        # Repaint at a fixed ~15 Hz, independent of how fast samples arrive
+        self._paint_timer = QtCore.QTimer(self)
+        self._paint_timer.setInterval(66)
+        self._paint_timer.timeout.connect(self._update_realtime_visualizations)
+        self._paint_timer.start()
 
         central = QWidget()
         self.setCentralWidget(central)
@@ -272,12 +447,15 @@ class MainWindow(QMainWindow):
         self.lap_table.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
         self.lap_table.setColumnWidth(0, 100)
 
-        # demo data for table
+        # Placeholder rows; items are created once and updated via setText
+        self._lap_items = []
         for i in range(8):
             lap_label = QTableWidgetItem(f"{i+1}.")
             self.lap_table.setVerticalHeaderItem(i, lap_label)
-            self.lap_table.setItem(i, 0, QTableWidgetItem("--:--:---"))
-            self.lap_table.setItem(i, 1, QTableWidgetItem("----"))
+            row_items = [QTableWidgetItem("--:--:---"), QTableWidgetItem("----")]
+            for col, item in enumerate(row_items):
+                self.lap_table.setItem(i, col, item)
+            self._lap_items.append(row_items)
 
         lap_layout.addWidget(self.lap_table)
 
@@ -383,6 +561,19 @@ class MainWindow(QMainWindow):
         
         driver_layout.addWidget(self.last_lap_label)
         driver_layout.addWidget(self.best_lap_label)
+
+        # live_data key -> label, for update_live_data
+        self._live_labels = {
+            "lap": self.lap_label,
+            "position": self.position_label,
+            "status": self.status_label,
+            "speed": self.speed_label,
+            "gear": self.gear_label,
+            "rpm": self.rpm_label,
+            "fuel": self.fuel_label,
+            "last": self.last_lap_label,
+            "best": self.best_lap_label,
+        }
         
         # Add stretch to push everything to the top
         driver_layout.addStretch()
@@ -392,8 +583,9 @@ class MainWindow(QMainWindow):
         comms_layout = QVBoxLayout()
         comms_group.setLayout(comms_layout)
 
-        self.comms_text = QTextEdit()
+        self.comms_text = QPlainTextEdit()
         self.comms_text.setReadOnly(True)
+        self.comms_text.setMaximumBlockCount(TRANSCRIPT_MAX_LINES)
         self.comms_text.setPlaceholderText("Radio messages will appear here...")
         comms_layout.addWidget(self.comms_text)
 
@@ -402,8 +594,9 @@ class MainWindow(QMainWindow):
         comment_layout = QVBoxLayout()
         comment_group.setLayout(comment_layout)
 
-        self.comment_text = QTextEdit()
+        self.comment_text = QPlainTextEdit()
         self.comment_text.setReadOnly(True)
+        self.comment_text.setMaximumBlockCount(TRANSCRIPT_MAX_LINES)
         self.comment_text.setPlaceholderText("Commentary will appear here...")
         comment_layout.addWidget(self.comment_text)
 
@@ -444,40 +637,21 @@ class MainWindow(QMainWindow):
     def update_live_data(self, live_data):
         """
         Called periodically (~6 times/sec) with live telemetry.
-        live_data: dict with current_lap, speed, gear, rpm, fuel, etc.
+        live_data: dict of preformatted label texts (see telemetry.live_data.format_live_data).
         """
-        # Extract live data
-        current_lap = live_data.get("current_lap", 1)
-        speed = live_data.get("speed", 0)
-        gear = live_data.get("gear", 0)
-        rpm = live_data.get("rpm", 0)
-        fuel = live_data.get("fuel", 0)
-        position = live_data.get("position", 0)
-        is_in_pit = live_data.get("is_in_pit", 0)
-        best_time = live_data.get("best_time", "")
-        last_time = live_data.get("last_time", "")
-        
-        # Format pit status
-        pit_status = "🏁 IN PIT" if is_in_pit else "🏎️ ON TRACK"
-        
-        # Format gear display
-        if gear == 0:
-            gear_display = "R"
-        elif gear == 1:
-            gear_display = "N"
-        else:
-            gear_display = str(gear - 1)
-        
-        # Update all labels
-        self.lap_label.setText(f"Lap: {current_lap}")
-        self.position_label.setText(f"Position: P{position}")
-        self.status_label.setText(f"Status: {pit_status}")
-        self.speed_label.setText(f"Speed: {speed:.1f} km/h")
-        self.gear_label.setText(f"Gear: {gear_display}")
-        self.rpm_label.setText(f"RPM: {rpm:,}")
-        self.fuel_label.setText(f"Fuel: {fuel:.1f} L")
-        self.last_lap_label.setText(f"Last: {last_time if last_time else '--:--:---'}")
-        self.best_lap_label.setText(f"Best: {best_time if best_time else '--:--:---'}")
+        # Update all labels (unchanged ones are skipped)
+        labels = self._live_labels
+        set_label = self._set_label
+        for key, text in live_data.items():
+            label = labels.get(key)
+            if label is not None:
+                set_label(label, text)
+
+    def _set_label(self, label, text):
+        """setText only when the text actually changed (avoids relayout/repaint)."""
+        if self._label_text.get(label) != text:
+            label.setText(text)
+            self._label_text[label] = text
 
     # ------------------ Wiring methods ------------------ #
 
@@ -509,7 +683,7 @@ class MainWindow(QMainWindow):
                 color: #EEEEEE;
                 font-size: 11px;
             }
-            QTableWidget, QTextEdit {
+            QTableWidget, QPlainTextEdit {
                 background-color: #1B1B1B;
                 color: #EEEEEE;
                 border: 1px solid #555555;
@@ -528,112 +702,129 @@ class MainWindow(QMainWindow):
 
     # ------------------ Public API for backend ------------------ #
 
-    def handle_realtime_sample(self, sample):
+    def set_realtime_source(self, ring):
+        """
+        Take realtime samples from a backend's SampleRing: it is drained on
+        every paint tick, so samples are handed over at the UI's own pace.
+        """
+        self._realtime_ring = ring
+
+    def handle_realtime_batch(self, samples):
         """
-        Handle real-time telemetry sample (called every frame ~60Hz).
-        sample: dict with lap_id, t, x, z, speed, gear, rpms, brake, throttle
+        Handle a batch of real-time telemetry samples (~50 ms worth).
+        Called for each batch drained from the realtime ring.
+        samples: telemetry.samples.SAMPLE_DTYPE array (lap_id, t, x, z, speed, gear, rpms, ...)
         """
-        lap_id = sample.get("lap_id", 0)
+        if len(samples) == 0:
+            return
 
-        # If lap changed, clear current lap buffer
-        if self.current_lap_id is None or lap_id != self.current_lap_id:
-            print(f"🔄 UI: Starting new lap buffer (Lap {lap_id + 1})")
-            self.current_lap_samples = []
-            self.current_lap_id = lap_id
+        # Split the batch wherever lap_id changes
+        lap_ids = samples["lap_id"]
+        bounds = np.flatnonzero(lap_ids[1:] != lap_ids[:-1]) + 1
+        for chunk in np.split(samples, bounds) if bounds.size else (samples,):
+            lap_id = int(chunk["lap_id"][0])
 
-        # Add sample to current lap buffer
-        self.current_lap_samples.append(sample)
+            # If lap changed, clear current lap buffer
+            if self.current_lap_id is None or lap_id != self.current_lap_id:
+                log.debug("🔄 UI: Starting new lap buffer (Lap %d)", lap_id + 1)
+                self.lap_trace.reset()
+                self.current_lap_id = lap_id
+                self._last_drawn_n = 0
 
-        # Debug: Print first sample received
-        if len(self.current_lap_samples) == 1:
-            print(f"📥 UI: First sample received - Speed: {sample.get('speed', 0):.1f} km/h, "
-                  f"Gear: {sample.get('gear', 0)}, RPM: {sample.get('rpms', 0)}")
+            # Debug: Print first sample received
+            if self.lap_trace.n == 0:
+                first = chunk[0]
+                log.debug("📥 UI: First sample received - Speed: %.1f km/h, Gear: %d, RPM: %d",
+                          first["speed"], first["gear"], first["rpms"])
 
-        # Update visualizations with current lap data (throttle updates to avoid overload)
-        # Only update every 5 samples (~12 updates/sec at 60Hz)
-        if len(self.current_lap_samples) % 5 == 0:
-            self._update_realtime_visualizations()
+            # Add samples to current lap buffer
+            self.lap_trace.extend(chunk)
 
     def _update_realtime_visualizations(self):
-        """Update all visualizations with current lap data"""
-        if len(self.current_lap_samples) < 2:
+        """
+        Update all visualizations with current lap data.
+        Driven by the paint timer; skipped when no new samples arrived.
+        """
+        if self._realtime_ring is not None:
+            for batch in self._realtime_ring.drain():
+                self.handle_realtime_batch(batch)
+
+        trace = self.lap_trace
+        n = trace.n
+        if n < 2 or n == self._last_drawn_n:
             return
 
-        # Debug: Print visualization update
-        if len(self.current_lap_samples) % 50 == 0:  # Print every ~4 seconds
-            print(f"🎨 UI: Updating visualizations ({len(self.current_lap_samples)} samples buffered)")
+        # Debug output is rate-limited to roughly every 4 seconds of samples
+        verbose = n // 250 != self._last_drawn_n // 250
+        if verbose:
+            log.debug("🎨 UI: Updating visualizations (%d samples buffered)", n)
+        self._last_drawn_n = n
 
         try:
-            # Extract arrays from samples
-            xs = np.array([s["x"] for s in self.current_lap_samples], dtype=float)
-            zs = np.array([s["z"] for s in self.current_lap_samples], dtype=float)
-            speeds = np.array([s["speed"] for s in self.current_lap_samples], dtype=float)
-            times = np.array([s["t"] for s in self.current_lap_samples], dtype=float)
-            gears = np.array([s.get("gear", 0) for s in self.current_lap_samples], dtype=float)
-            rpms = np.array([s.get("rpms", 0) for s in self.current_lap_samples], dtype=float)
-            brakes = np.array([s.get("brake", 0) for s in self.current_lap_samples], dtype=float)
-
-            # Tire data (FL, FR, RL, RR)
-            tyre_pressure_fl = np.array([s.get("tyre_pressure_fl", 0) for s in self.current_lap_samples], dtype=float)
-            tyre_pressure_fr = np.array([s.get("tyre_pressure_fr", 0) for s in self.current_lap_samples], dtype=float)
-            tyre_pressure_rl = np.array([s.get("tyre_pressure_rl", 0) for s in self.current_lap_samples], dtype=float)
-            tyre_pressure_rr = np.array([s.get("tyre_pressure_rr", 0) for s in self.current_lap_samples], dtype=float)
-
-            tyre_temp_fl = np.array([s.get("tyre_temp_fl", 0) for s in self.current_lap_samples], dtype=float)
-            tyre_temp_fr = np.array([s.get("tyre_temp_fr", 0) for s in self.current_lap_samples], dtype=float)
-            tyre_temp_rl = np.array([s.get("tyre_temp_rl", 0) for s in self.current_lap_samples], dtype=float)
-            tyre_temp_rr = np.array([s.get("tyre_temp_rr", 0) for s in self.current_lap_samples], dtype=float)
-
-            # Normalize times to start from 0
-            times = times - times[0]
+            # Views into the lap buffer (times already start from 0), thinned
+            # to ~2 points per pixel for the map and ~1 per pixel for graphs:
+            # anything denser only adds sub-pixel segments to render
+            track_idx = downsample_index(n, max(int(self.track_canvas.figure.bbox.width) * 2, 512))
+            idx = downsample_index(n, max(self.speed_canvas.width(), 256))
+            speeds = trace.view("speed", idx)
+            times = trace.view("t", idx)
 
             # Update track map
             try:
-                self.track_canvas.plot_track(xs, zs, speeds)
+                self.track_canvas.plot_track(
+                    trace.view("x", track_idx), trace.view("z", track_idx), trace.view("speed", track_idx),
+                    trace.extent("x"), trace.extent("z"), trace.extent("speed"),
+                )
             except Exception as e:
-                if len(self.current_lap_samples) % 50 == 0:
-                    print(f"⚠️  Warning: Track map update failed: {e}")
+                if verbose:
+                    log.warning("⚠️  Track map update failed: %s", e)
 
             # Update time-series graphs
             try:
-                self.speed_canvas.update_data(times, speeds)
-                self.gear_canvas.update_data(times, gears)
-                self.rpm_canvas.update_data(times, rpms)
-                self.brake_canvas.update_data(times, brakes * 100)  # Scale 0-1 to 0-100%
+                brake_lo, brake_hi = trace.extent("brake")
+                brake = trace.view("brake", idx)
+                if self._brake_buf.size < brake.size:
+                    self._brake_buf = np.empty(max(brake.size, 2 * self._brake_buf.size), dtype=np.float32)
+                brake_pct = np.multiply(brake, 100, out=self._brake_buf[:brake.size])
+                self.speed_canvas.update_data(times, speeds, trace.extent("speed"))
+                self.gear_canvas.update_data(times, trace.view("gear", idx), trace.extent("gear"))
+                self.rpm_canvas.update_data(times, trace.view("rpms", idx), trace.extent("rpms"))
+                self.brake_canvas.update_data(  # Scale 0-1 to 0-100%
+                    times, brake_pct, (brake_lo * 100, brake_hi * 100)
+                )
             except Exception as e:
-                if len(self.current_lap_samples) % 50 == 0:
-                    print(f"⚠️  Warning: Time-series graph update failed: {e}")
+                if verbose:
+                    log.warning("⚠️  Time-series graph update failed: %s", e)
 
-            # Update tire graphs
+            # Update tire graphs (FL, FR, RL, RR)
             try:
-                self.tyre_pressure_canvas.update_data(times, [
-                    tyre_pressure_fl, tyre_pressure_fr, tyre_pressure_rl, tyre_pressure_rr
-                ])
-                self.tyre_temp_canvas.update_data(times, [
-                    tyre_temp_fl, tyre_temp_fr, tyre_temp_rl, tyre_temp_rr
-                ])
+                pressures = ("tyre_pressure_fl", "tyre_pressure_fr", "tyre_pressure_rl", "tyre_pressure_rr")
+                temps = ("tyre_temp_fl", "tyre_temp_fr", "tyre_temp_rl", "tyre_temp_rr")
+                self.tyre_pressure_canvas.update_data(
+                    times, [trace.view(name, idx) for name in pressures], trace.extent(*pressures)
+                )
+                self.tyre_temp_canvas.update_data(
+                    times, [trace.view(name, idx) for name in temps], trace.extent(*temps)
+                )
             except Exception as e:
-                if len(self.current_lap_samples) % 50 == 0:
-                    print(f"⚠️  Warning: Tire graph update failed: {e}")
+                if verbose:
+                    log.warning("⚠️  Tire graph update failed: %s", e)
 
-        except Exception as e:
-            print(f"❌ Error in visualization update: {e}")
-            import traceback
-            traceback.print_exc()
+        except Exception:
+            log.exception("❌ Error in visualization update")
 
     def handle_lap_complete(self, lap_id, samples):
         """
         Entry point for the LapBuffer callback.
         Called when a lap is completed.
-        samples: list of dicts with:
-                 t, x, z, speed, gear, rpms, brake, throttle
+        samples: telemetry.samples.SAMPLE_DTYPE array (t, x, z, speed, gear, rpms, brake, throttle, ...)
         """
-        if not samples:
+        if len(samples) == 0:
             return
 
-        print(f"🏁 UI: Lap {lap_id} completed with {len(samples)} samples")
+        log.info("🏁 UI: Lap %d completed with %d samples", lap_id, len(samples))
 
-        times = np.array([s["t"] for s in samples], dtype=float)
+        times = samples["t"]
 
         # Update window title
         self.setWindowTitle(f"AC Telemetry Dashboard – Lap {lap_id}")
@@ -642,19 +833,27 @@ class MainWindow(QMainWindow):
         times = times - times[0]
 
         # Update lap table with lap time
-        row = min(lap_id - 1, self.lap_table.rowCount() - 1)
+        row = min(lap_id - 1, len(self._lap_items) - 1)
         if row >= 0 and len(times) > 0:
             lap_time_seconds = times[-1]
             minutes = int(lap_time_seconds // 60)
             seconds = lap_time_seconds % 60
             lap_time = f"{minutes}:{seconds:06.3f}"
-            self.lap_table.setItem(row, 0, QTableWidgetItem(lap_time))
-            self.lap_table.setItem(row, 1, QTableWidgetItem("--"))
+            self._lap_items[row][0].setText(lap_time)
+            self._lap_items[row][1].setText("--")
 
         # The visualization is already showing the current lap in real-time,
         # so we don't need to redraw here. The real-time handler will
         # automatically start showing the next lap.
 
+    def append_comms(self, message: str):
+        """Add one line to the communications transcript."""
+        self.comms_text.appendPlainText(message)
+
+    def append_commentary(self, message: str):
+        """Add one line to the commentator transcript."""
+        self.comment_text.appendPlainText(message)
+
 
 def main():
     app = QtWidgets.QApplication(sys.argv)
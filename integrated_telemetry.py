@@ -1,16 +1,36 @@
 # integrated_telemetry.py
+import logging
+import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from PyQt5 import QtWidgets
 
-print("="*60)
-print("🚀 F1 TELEMETRY DASHBOARD STARTING...")
-print("="*60)
+# Log level comes from F1_LOG (DEBUG, INFO, WARNING, ...); default INFO.
+# Records are queued and written to the console by a listener thread, so
+# logging from the UI or telemetry threads never waits on stdout.
+log = logging.getLogger("telemetry")
+log.propagate = False
+_log_queue = queue.SimpleQueue()
+log.addHandler(QueueHandler(_log_queue))
+_console = logging.StreamHandler()
+_console.setFormatter(logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s"))
+log_listener = QueueListener(_log_queue, _console)
+
+_log_level = (os.getenv("F1_LOG") or "INFO").upper()
+try:
+    log.setLevel(_log_level)
+except ValueError:
+    log.setLevel(logging.INFO)
+    log.warning("Unknown F1_LOG level %r, using INFO", _log_level)
+
+log.debug("🚀 F1 TELEMETRY DASHBOARD STARTING...")
 
 from dashboard import MainWindow
 from telemetry.ac_shared_memory import AcTelemetryWorker
 from telemetry.acc_backend import AccTelemetryWorker  # ← FIXED
 
-print("✅ All modules imported successfully")
+log.debug("✅ All modules imported successfully")
 
 
 def main(game: str = "ac"):
@@ -19,15 +39,15 @@ def main(game: str = "ac"):
 
     :param game: "ac" for Assetto Corsa, "acc" for Assetto Corsa Competizione
     """
-    print(f"\n📋 Starting dashboard for: {game.upper()}")
-    print("🔧 Creating Qt application...")
+    log.info("📋 Starting dashboard for: %s", game.upper())
+    log.debug("🔧 Creating Qt application...")
     app = QtWidgets.QApplication(sys.argv)
 
-    print("🖥️  Creating main window...")
+    log.debug("🖥️  Creating main window...")
     window = MainWindow()
 
     # Choose backend
-    print(f"🎮 Initializing {game.upper()} telemetry backend...")
+    log.debug("🎮 Initializing %s telemetry backend...", game.upper())
     if game == "ac":
         telemetry_thread = AcTelemetryWorker()
     elif game == "acc":
@@ -35,34 +55,33 @@ def main(game: str = "ac"):
     else:
         raise ValueError(f"Unknown game '{game}'. Use 'ac' or 'acc'.")
 
-    print("✅ Backend initialized")
+    log.debug("✅ Backend initialized")
 
     # Connect signals
-    print("🔗 Connecting Qt signals...")
+    log.debug("🔗 Connecting Qt signals...")
     telemetry_thread.lap_completed.connect(window.handle_lap_complete)
-    telemetry_thread.status_update.connect(lambda msg: print(f"[Status] {msg}"))
+    if log.isEnabledFor(logging.INFO):
+        telemetry_thread.status_update.connect(lambda msg: log.info("[Status] %s", msg))
 
     # Connect new signals (these exist in both backends now)
     if hasattr(telemetry_thread, 'session_info_update'):
         telemetry_thread.session_info_update.connect(window.update_session_info)
     if hasattr(telemetry_thread, 'live_data_update'):
         telemetry_thread.live_data_update.connect(window.update_live_data)
-    if hasattr(telemetry_thread, 'realtime_sample'):
-        telemetry_thread.realtime_sample.connect(window.handle_realtime_sample)
+    if hasattr(telemetry_thread, 'realtime_ring'):
+        window.set_realtime_source(telemetry_thread.realtime_ring)
 
-    print("✅ Signals connected")
+    log.debug("✅ Signals connected")
 
     # Start telemetry thread
-    print("🚀 Starting telemetry worker thread...")
+    log.debug("🚀 Starting telemetry worker thread...")
     telemetry_thread.start()
 
     # Show window
-    print("🪟 Showing UI window...")
+    log.debug("🪟 Showing UI window...")
     window.show()
 
-    print("\n" + "="*60)
-    print("✅ DASHBOARD READY - Check AC for shared memory connection")
-    print("="*60 + "\n")
+    log.info("✅ DASHBOARD READY - Check %s for a connection", game.upper())
 
     # Run Qt event loop
     result = app.exec_()
@@ -76,24 +95,18 @@ def main(game: str = "ac"):
 
 if __name__ == "__main__":
     # Parse command line argument
-    import sys
     game = "ac"
     if "--acc" in sys.argv:
         game = "acc"
 
-    print(f"🎯 Command line args: {sys.argv}")
-    print(f"🎮 Selected game: {game}\n")
+    log.debug("🎯 Command line args: %s", sys.argv)
+    log.debug("🎮 Selected game: %s", game)
 
+    log_listener.start()
     try:
         main(game)
-    except Exception as e:
-        print("\n" + "="*60)
-        print("❌ FATAL ERROR:")
-        print("="*60)
-        print(f"Error type: {type(e).__name__}")
-        print(f"Error message: {e}")
-        import traceback
-        print("\nFull traceback:")
-        traceback.print_exc()
-        print("="*60)
-        sys.exit(1)
\ No newline at end of file
+    except Exception:
+        log.exception("❌ FATAL ERROR")
+        sys.exit(1)
+    finally:
+        log_listener.stop()  # flushes queued records
\ No newline at end of file
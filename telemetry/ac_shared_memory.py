@@ -1,12 +1,21 @@
 # telemetry/ac_shared_memory.py
 import ctypes as ct
+import functools
+import logging
 import mmap
+import struct
 import time
 from typing import List, Dict, Any, Optional
 
+import numpy as np
 from PyQt5 import QtCore
 
 from .lap_buffer import LapBuffer
+from .live_data import format_live_data
+from .samples import SAMPLE_DTYPE, SampleBatcher, SampleRing, make_sample
+
+
+log = logging.getLogger(__name__)
 
 
 # ===================== PHYSICS SHARED MEMORY =====================
@@ -140,29 +149,69 @@ PHYSICS_SIZE = ct.sizeof(SPageFilePhysics)
 GRAPHICS_SIZE = ct.sizeof(SPageFileGraphics)
 STATIC_SIZE = ct.sizeof(SPageFileStatic)
 
+POLL_PERIOD_NS = 1_000_000_000 // 60  # nanoseconds between shared memory polls
+SEQLOCK_RETRIES = 3     # re-reads of a physics packet that changed mid-read
+STALE_RETRY_S = 0.002   # wait before re-checking when no new packet was published
+
+# Precompiled readers for the fields the poll loop reads, at their ctypes
+# offsets; unpack_from straight off the mapping skips ctypes attribute access.
+_PACKET_ID = struct.Struct("<i")
+_PHYS_HEAD = struct.Struct("<ifffiiff")  # packetId, gas, brake, fuel, gear, rpms, steerAngle, speedKmh
+_PHYS_WHEELS = struct.Struct("<4f")      # FL, FR, RL, RR
+_PRESSURE_OFFSET = SPageFilePhysics.wheelsPressure.offset
+_TYRE_TEMP_OFFSET = SPageFilePhysics.tyreCoreTemperature.offset
+_GFX_LAPS = struct.Struct("<i")
+_GFX_LAPS_OFFSET = SPageFileGraphics.completedLaps.offset
+_GFX_XZ = struct.Struct("<f4xf")         # carCoordinates x, (y skipped), z
+_GFX_XZ_OFFSET = SPageFileGraphics.carCoordinates.offset
+# Cold fields, read with the live data (~6x/sec)
+_GFX_INT = struct.Struct("<i")
+_GFX_POSITION_OFFSET = SPageFileGraphics.position.offset
+_GFX_IN_PIT_OFFSET = SPageFileGraphics.isInPit.offset
+_GFX_TIME = struct.Struct("15s")         # c_char[15], NUL-terminated
+_GFX_LAST_TIME_OFFSET = SPageFileGraphics.lastTime.offset
+_GFX_BEST_TIME_OFFSET = SPageFileGraphics.bestTime.offset
+
 
 # ===================== SHARED MEMORY HELPERS =====================
 
-def open_shared_memory(name: str, size: int) -> Optional[mmap.mmap]:
-    """Open an existing named shared memory region created by Assetto Corsa."""
+def open_shared_memory(name: str, size: int, access: int = mmap.ACCESS_READ) -> Optional[mmap.mmap]:
+    """
+    Open an existing named shared memory region created by Assetto Corsa.
+    """
     try:
-        return mmap.mmap(0, size, tagname=name, access=mmap.ACCESS_READ)
+        mm = mmap.mmap(0, size, tagname=name, access=access)
     except Exception as e:
-        print(f"ERROR: Could not open shared memory '{name}': {e}")
-        print("Make sure Assetto Corsa is running and you're in a session.")
+        log.error("Could not open shared memory '%s': %s", name, e)
         return None
+    prefault(mm)
+    return mm
 
 
-def read_physics(mm: mmap.mmap) -> SPageFilePhysics:
-    mm.seek(0)
-    raw = mm.read(PHYSICS_SIZE)
-    return SPageFilePhysics.from_buffer_copy(raw)
+def prefault(mm: mmap.mmap) -> None:
+    """
+    Touch every page of the mapping once so the first reads in the poll
+    loop don't take page faults. madvise is only available on Unix.
+    """
+    if hasattr(mm, "madvise"):
+        mm.madvise(mmap.MADV_WILLNEED)
+    mm[::mmap.PAGESIZE]
 
 
-def read_graphics(mm: mmap.mmap) -> SPageFileGraphics:
-    mm.seek(0)
-    raw = mm.read(GRAPHICS_SIZE)
-    return SPageFileGraphics.from_buffer_copy(raw)
+def close_shared_memory(mm: mmap.mmap) -> None:
+    """Tell the kernel we're done with the pages (where madvise exists), then unmap."""
+    if hasattr(mm, "madvise"):
+        mm.madvise(mmap.MADV_DONTNEED)
+    mm.close()
+
+
+@functools.lru_cache(maxsize=64)
+def decode_c_string(raw: bytes) -> str:
+    """
+    Decode a fixed-size C char field. Cached by raw bytes, since fields like
+    lastTime/bestTime only change a few times per lap but are read ~6x/sec.
+    """
+    return raw.decode('utf-8', errors='ignore')
 
 
 def read_static(mm: mmap.mmap) -> SPageFileStatic:
@@ -178,20 +227,18 @@ class AcTelemetryWorker(QtCore.QThread):
     Background thread that reads Assetto Corsa telemetry from shared memory
     and emits normalized packets to the GUI.
     """
-    lap_completed = QtCore.pyqtSignal(int, list)  # (lap_id, samples: List[Dict])
+    lap_completed = QtCore.pyqtSignal(int, object)  # (lap_id, samples: SAMPLE_DTYPE ndarray)
     status_update = QtCore.pyqtSignal(str)        # status message
     session_info_update = QtCore.pyqtSignal(dict) # session info (track, car, driver)
     live_data_update = QtCore.pyqtSignal(dict)    # live telemetry updates
-    realtime_sample = QtCore.pyqtSignal(dict)     # realtime telemetry sample (every frame)
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self.running = False
+        self.realtime_ring = SampleRing()  # realtime SAMPLE_DTYPE batches, drained by the GUI
 
     def run(self):
-        print("\n" + "="*60)
-        print("🔍 AC TELEMETRY WORKER STARTING")
-        print("="*60)
+        log.debug("🔍 AC TELEMETRY WORKER STARTING")
         self.status_update.emit("Connecting to Assetto Corsa...")
 
         mm_phys = open_shared_memory(SHM_NAME_PHYSICS, PHYSICS_SIZE)
@@ -199,12 +246,12 @@ class AcTelemetryWorker(QtCore.QThread):
         mm_static = open_shared_memory(SHM_NAME_STATIC, STATIC_SIZE)
 
         if mm_phys is None or mm_graph is None:
-            print("❌ ERROR: Could not connect to AC shared memory.")
-            print("   Make sure Assetto Corsa is running and you're in a session.")
+            log.error("❌ Could not connect to AC shared memory. "
+                      "Make sure Assetto Corsa is running and you're in a session.")
             self.status_update.emit("ERROR: Could not connect to AC shared memory.")
             return
 
-        print("✅ Successfully connected to AC shared memory!")
+        log.info("✅ Successfully connected to AC shared memory!")
         self.status_update.emit("Connected! Start driving...")
 
         # Read static info once and emit it
@@ -221,46 +268,111 @@ class AcTelemetryWorker(QtCore.QThread):
                     "max_rpm": static_data.maxRpm,
                     "max_fuel": static_data.maxFuel,
                 }
-                print(f"📊 Session Info:")
-                print(f"   Track: {session_data['track']} ({session_data['track_config']})")
-                print(f"   Car: {session_data['car_model']}")
-                print(f"   Driver: {session_data['player_name']} {session_data['player_surname']}")
+                log.info("📊 Session: %s (%s) | Car: %s | Driver: %s %s",
+                         session_data["track"], session_data["track_config"], session_data["car_model"],
+                         session_data["player_name"], session_data["player_surname"])
                 self.session_info_update.emit(session_data)
             except Exception as e:
-                print(f"⚠️  Warning: Could not read static info: {e}")
+                log.warning("⚠️  Could not read static info: %s", e)
+
+        # LapBuffer reports finished laps straight through the (callable) bound signal
+        lap_buffer = LapBuffer(self.lap_completed.emit)
 
-        # LapBuffer with callback that emits a Qt signal
-        lap_buffer = LapBuffer(
-            on_lap_complete=lambda lap_id, samples: self.lap_completed.emit(lap_id, samples)
-        )
+        # Realtime samples go to the GUI in small batches (~20/sec) through the ring
+        batcher = SampleBatcher(self.realtime_ring.put)
 
-        t0 = time.time()
+        t0_ns = time.perf_counter_ns()
         self.running = True
         frame_count = 0
-        last_debug_time = time.time()
+        dropped_frames = 0
+        last_drop_report_ns = 0
+        next_deadline_ns = t0_ns
+        last_packet_id = None
+        stale = False  # no new physics packet since the last poll
+        last_gfx_packet_id = None
         last_lap_id = -1
 
-        print("\n🏁 Starting telemetry loop (reading at ~60Hz)...")
-        print("   📍 IMPORTANT: Make sure you're IN THE CAR and DRIVING!")
-        print("   📍 Car coordinates will only appear when physics is active\n")
+        # One record reused every frame; LapBuffer and the batcher copy it in
+        sample_data = np.empty((), dtype=SAMPLE_DTYPE)
+
+        # Hot-loop callables bound to locals once (local lookups are cheaper
+        # than attribute lookups every frame)
+        perf_counter_ns = time.perf_counter_ns
+        sleep = time.sleep
+        read_packet_id = _PACKET_ID.unpack_from
+        read_phys_head = _PHYS_HEAD.unpack_from
+        read_wheels = _PHYS_WHEELS.unpack_from
+        read_xz = _GFX_XZ.unpack_from
+        read_laps = _GFX_LAPS.unpack_from
+        add_lap_sample = lap_buffer.add_sample
+        add_realtime_sample = batcher.add
+        debug_enabled = log.isEnabledFor(logging.DEBUG)
+
+        # Keep GUI repaint bursts from preempting the sampler (maps to
+        # THREAD_PRIORITY_TIME_CRITICAL on Windows; best effort elsewhere)
+        self.setPriority(QtCore.QThread.TimeCriticalPriority)
+
+        log.info("🏁 Starting telemetry loop (reading at ~60Hz). Car coordinates only "
+                 "appear when physics is active: make sure you're IN THE CAR and DRIVING!")
 
         try:
             while self.running:
-                phys = read_physics(mm_phys)
-                gfx = read_graphics(mm_graph)
-
-                now = time.time()
-                elapsed = now - t0
-
-                x = gfx.carCoordinates[0]
-                z = gfx.carCoordinates[2]
-                lap_id = gfx.completedLaps
-                speed = phys.speedKmh
+                # ~60 Hz loop: sleep until the next deadline, so the time spent
+                # on the previous frame doesn't stretch the period
+                tick_ns = perf_counter_ns()
+                slack_ns = next_deadline_ns - tick_ns
+                if slack_ns > 0:
+                    sleep(slack_ns * 1e-9)
+                    next_deadline_ns += POLL_PERIOD_NS
+                elif slack_ns < -POLL_PERIOD_NS:
+                    # Fell more than a frame behind: resync instead of bursting to catch up
+                    dropped_frames += -slack_ns // POLL_PERIOD_NS
+                    next_deadline_ns = tick_ns + POLL_PERIOD_NS
+                    if tick_ns - last_drop_report_ns >= 1_000_000_000:
+                        self.status_update.emit(f"Telemetry loop behind schedule ({dropped_frames} frames dropped)")
+                        last_drop_report_ns = tick_ns
+                else:
+                    next_deadline_ns += POLL_PERIOD_NS
+
+                # packetId works as a sequence number: nothing new since the
+                # last poll -> check again shortly instead of waiting a whole
+                # period (AC running below 60 Hz, paused, in menus, ...)
+                packet_id = read_packet_id(mm_phys)[0]
+                if packet_id == last_packet_id:
+                    if not stale:
+                        # Hand over the partial batch now so the live trace
+                        # doesn't stop short while nothing new arrives
+                        batcher.flush()
+                        stale = True
+                    sleep(STALE_RETRY_S)
+                    next_deadline_ns = perf_counter_ns()  # re-anchor on the next fresh packet
+                    continue
+
+                # Snapshot the physics fields; if AC wrote a new packet while
+                # we were reading, the snapshot may be torn -> read again
+                for _ in range(SEQLOCK_RETRIES):
+                    packet_id, gas, brake, fuel, raw_gear, rpms, _, speed = read_phys_head(mm_phys)
+                    tyre_pressure = read_wheels(mm_phys, _PRESSURE_OFFSET)
+                    tyre_temp = read_wheels(mm_phys, _TYRE_TEMP_OFFSET)
+                    if read_packet_id(mm_phys)[0] == packet_id:
+                        break
+                last_packet_id = packet_id
+                stale = False
+
+                # Monotonic session time (immune to wall-clock adjustments)
+                elapsed = (perf_counter_ns() - t0_ns) * 1e-9
+
+                # Graphics has its own packetId and updates at display rate,
+                # often slower than physics: keep last values until it moves
+                gfx_packet_id = read_packet_id(mm_graph)[0]
+                if gfx_packet_id != last_gfx_packet_id:
+                    x, z = read_xz(mm_graph, _GFX_XZ_OFFSET)
+                    lap_id = read_laps(mm_graph, _GFX_LAPS_OFFSET)[0]
+                    last_gfx_packet_id = gfx_packet_id
 
                 # Convert AC gear to display gear
                 # AC: 0=R, 1=N, 2=1st, 3=2nd, etc.
                 # Display: -1=R, 0=N, 1=1st, 2=2nd, etc.
-                raw_gear = phys.gear
                 if raw_gear == 0:
                     display_gear = -1  # Reverse
                 elif raw_gear == 1:
@@ -268,96 +380,67 @@ class AcTelemetryWorker(QtCore.QThread):
                 else:
                     display_gear = raw_gear - 1  # 1st, 2nd, 3rd, etc.
 
-                # Debug print every 60 frames (~1 second at 60Hz)
+                # Debug output every 60 frames (~1 second at 60Hz)
                 frame_count += 1
-                if frame_count % 60 == 0:
-                    print(f"📦 Packet #{frame_count:04d} | Lap: {lap_id+1} | Speed: {speed:6.1f} km/h | "
-                          f"Gear: {display_gear} (raw:{raw_gear}) | RPM: {phys.rpms:5d} | Pos: ({x:.1f}, {z:.1f})")
+                if debug_enabled and frame_count % 60 == 0:
+                    log.debug("📦 Packet #%04d | Lap: %d | Speed: %6.1f km/h | Gear: %d (raw:%d) | RPM: %5d | Pos: (%.1f, %.1f)",
+                              frame_count, lap_id + 1, speed, display_gear, raw_gear, rpms, x, z)
 
                 # Debug warning if coordinates are still zero after 5 seconds
                 if frame_count == 300 and x == 0 and z == 0:
-                    print("⚠️  WARNING: Car coordinates still (0,0) after 5 seconds!")
-                    print("   Make sure you're IN THE CAR and DRIVING (not in menus or paused)")
+                    log.warning("⚠️  Car coordinates still (0,0) after 5 seconds! "
+                                "Make sure you're IN THE CAR and DRIVING (not in menus or paused)")
 
-                # Debug print when lap changes
+                # Log when lap changes
                 if lap_id != last_lap_id and last_lap_id != -1:
-                    print(f"\n🏁 LAP COMPLETED! Lap {last_lap_id+1} -> {lap_id+1}\n")
+                    log.info("🏁 LAP COMPLETED! Lap %d -> %d", last_lap_id + 1, lap_id + 1)
                 last_lap_id = lap_id
 
-                # Create sample dict
-                sample_data = {
-                    "lap_id": lap_id,
-                    "t": elapsed,
-                    "x": x,
-                    "z": z,
-                    "speed": speed,
-                    "gear": display_gear,
-                    "rpms": phys.rpms,
-                    "brake": phys.brake,
-                    "throttle": phys.gas,
-                    # Tire data (4 values: FL, FR, RL, RR)
-                    "tyre_pressure_fl": phys.wheelsPressure[0],
-                    "tyre_pressure_fr": phys.wheelsPressure[1],
-                    "tyre_pressure_rl": phys.wheelsPressure[2],
-                    "tyre_pressure_rr": phys.wheelsPressure[3],
-                    "tyre_temp_fl": phys.tyreCoreTemperature[0],
-                    "tyre_temp_fr": phys.tyreCoreTemperature[1],
-                    "tyre_temp_rl": phys.tyreCoreTemperature[2],
-                    "tyre_temp_rr": phys.tyreCoreTemperature[3],
-                }
-
-                # Feed sample into lap buffer
-                lap_buffer.add_sample(
-                    lap_id=lap_id,
-                    t=elapsed,
-                    x=x,
-                    z=z,
-                    speed_kmh=speed,
+                # Create sample record (tire data: 4 values FL, FR, RL, RR)
+                make_sample(
+                    lap_id, elapsed, x, z, speed,
                     gear=display_gear,
-                    rpms=phys.rpms,
-                    brake=phys.brake,
-                    throttle=phys.gas,
-                    # Tire data
-                    tyre_pressure_fl=phys.wheelsPressure[0],
-                    tyre_pressure_fr=phys.wheelsPressure[1],
-                    tyre_pressure_rl=phys.wheelsPressure[2],
-                    tyre_pressure_rr=phys.wheelsPressure[3],
-                    tyre_temp_fl=phys.tyreCoreTemperature[0],
-                    tyre_temp_fr=phys.tyreCoreTemperature[1],
-                    tyre_temp_rl=phys.tyreCoreTemperature[2],
-                    tyre_temp_rr=phys.tyreCoreTemperature[3],
+                    rpms=rpms,
+                    brake=brake,
+                    throttle=gas,
+                    tyre_pressure=tyre_pressure,
+                    tyre_temp=tyre_temp,
+                    out=sample_data,
                 )
 
-                # Emit real-time sample for live visualization
-                self.realtime_sample.emit(sample_data)
+                # Feed sample into lap buffer
+                add_lap_sample(lap_id, sample_data)
+
+                # Queue real-time sample for live visualization
+                add_realtime_sample(sample_data, elapsed)
 
                 # Emit live data every 10 frames (~6 times/sec at 60Hz)
                 if frame_count % 10 == 0:
-                    live_data = {
-                        "current_lap": lap_id + 1,
-                        "speed": speed,
-                        "gear": raw_gear,  # Use raw for live display (dashboard will convert)
-                        "rpm": phys.rpms,
-                        "fuel": phys.fuel,
-                        "position": gfx.position,
-                        "is_in_pit": gfx.isInPit,
-                        "current_time": gfx.currentTime.decode('utf-8', errors='ignore'),
-                        "last_time": gfx.lastTime.decode('utf-8', errors='ignore'),
-                        "best_time": gfx.bestTime.decode('utf-8', errors='ignore'),
-                    }
+                    live_data = format_live_data(
+                        current_lap=lap_id + 1,
+                        speed=speed,
+                        gear=display_gear,
+                        rpm=rpms,
+                        fuel=fuel,
+                        position=_GFX_INT.unpack_from(mm_graph, _GFX_POSITION_OFFSET)[0],
+                        is_in_pit=_GFX_INT.unpack_from(mm_graph, _GFX_IN_PIT_OFFSET)[0],
+                        last_time=decode_c_string(
+                            _GFX_TIME.unpack_from(mm_graph, _GFX_LAST_TIME_OFFSET)[0].partition(b"\0")[0]),
+                        best_time=decode_c_string(
+                            _GFX_TIME.unpack_from(mm_graph, _GFX_BEST_TIME_OFFSET)[0].partition(b"\0")[0]),
+                    )
                     self.live_data_update.emit(live_data)
 
-                # ~60 Hz loop
-                time.sleep(1 / 60.0)
-
         except Exception as e:
             self.status_update.emit(f"Error in telemetry loop: {str(e)}")
         finally:
+            batcher.flush()
             try:
-                mm_phys.close()
-                mm_graph.close()
+                # Reverse of the order they were opened in
                 if mm_static is not None:
-                    mm_static.close()
+                    close_shared_memory(mm_static)
+                close_shared_memory(mm_graph)
+                close_shared_memory(mm_phys)
             except Exception:
                 pass
             self.status_update.emit("Disconnected from Assetto Corsa.")
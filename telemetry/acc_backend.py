@@ -5,6 +5,10 @@ from typing import Dict, Any, List
 from PyQt5 import QtCore
 from enum import IntEnum
 
+from .lap_buffer import LapBuffer
+from .live_data import format_live_data
+from .samples import SampleBatcher, SampleRing, make_sample
+
 
 # ===================== ACC BROADCASTING PROTOCOL ENUMS =====================
 
@@ -306,11 +310,10 @@ class AccPacketParser:
 
 class AccTelemetryWorker(QtCore.QThread):
     """Background thread that connects to ACC via UDP broadcasting"""
-    lap_completed = QtCore.pyqtSignal(int, list)
+    lap_completed = QtCore.pyqtSignal(int, object)  # (lap_number, samples: SAMPLE_DTYPE ndarray)
     status_update = QtCore.pyqtSignal(str)
     session_info_update = QtCore.pyqtSignal(dict)
     live_data_update = QtCore.pyqtSignal(dict)
-    realtime_sample = QtCore.pyqtSignal(dict)  # realtime telemetry sample (every frame)
 
     def __init__(self, host="127.0.0.1", port=9000, password="", display_name="PythonTelemetry"):
         super().__init__()
@@ -323,8 +326,9 @@ class AccTelemetryWorker(QtCore.QThread):
         self.focused_car_index = 0
         self.car_data = {}
         self.track_info = {}
-        self.current_lap_samples = {}  # car_index -> [samples]
-        self.last_lap_count = {}  # car_index -> lap_count
+        self.lap_buffers = {}  # car_index -> LapBuffer
+        self.realtime_ring = SampleRing()  # realtime SAMPLE_DTYPE batches, drained by the GUI
+        self.batcher = SampleBatcher(self.realtime_ring.put)
         
     def run(self):
         self.status_update.emit("Connecting to ACC...")
@@ -394,6 +398,7 @@ class AccTelemetryWorker(QtCore.QThread):
                             last_realtime = time.time()
                     
                 except socket.timeout:
+                    self.batcher.flush()
                     if not registered and self.running:
                         # Retry registration
                         self._send_registration(sock)
@@ -402,6 +407,7 @@ class AccTelemetryWorker(QtCore.QThread):
         except Exception as e:
             self.status_update.emit(f"Error: {str(e)}")
         finally:
+            self.batcher.flush()
             if self.connection_id:
                 self._send_unregistration(sock)
             sock.close()
@@ -460,62 +466,53 @@ class AccTelemetryWorker(QtCore.QThread):
         laps = car_update.get("laps", 0)
 
         # Initialize if first time seeing this car
-        if car_index not in self.current_lap_samples:
-            self.current_lap_samples[car_index] = []
-            self.last_lap_count[car_index] = laps
+        lap_buffer = self.lap_buffers.get(car_index)
+        if lap_buffer is None:
+            # LapBuffer reports the finished lap's count; ACC numbers laps from 1
+            lap_buffer = self.lap_buffers[car_index] = LapBuffer(
+                on_lap_complete=lambda lap_id, samples: self.lap_completed.emit(lap_id + 1, samples)
+            )
 
         # Add sample to current lap
-        sample = {
-            "t": time.time(),
-            "lap_id": laps,
-            "x": car_update.get("world_pos_x", 0),
-            "z": car_update.get("world_pos_z", 0),
-            "speed": car_update.get("kmh", 0),
-            "gear": car_update.get("gear", 0),
-            "rpms": 0,  # ACC doesn't expose RPM directly
-            "brake": 0,  # Would need physics data
-            "throttle": 0,  # Would need physics data
-            # Tire data not available in ACC broadcasting API
-            "tyre_pressure_fl": 0,
-            "tyre_pressure_fr": 0,
-            "tyre_pressure_rl": 0,
-            "tyre_pressure_rr": 0,
-            "tyre_temp_fl": 0,
-            "tyre_temp_fr": 0,
-            "tyre_temp_rl": 0,
-            "tyre_temp_rr": 0,
-        }
-        self.current_lap_samples[car_index].append(sample)
-
-        # Emit real-time sample for live visualization
-        self.realtime_sample.emit(sample)
-
-        # Check for lap completion
-        if laps > self.last_lap_count[car_index]:
-            # Lap completed!
-            if self.current_lap_samples[car_index]:
-                self.lap_completed.emit(laps, self.current_lap_samples[car_index])
+        # RPM, brake, throttle and tire data are not available in the ACC
+        # broadcasting API (would need physics data), so they stay at zero
+        sample = make_sample(
+            laps,
+            time.time(),
+            car_update.get("world_pos_x", 0),
+            car_update.get("world_pos_z", 0),
+            car_update.get("kmh", 0),
+            gear=self._sample_gear(car_update.get("gear", 0)),
+        )
+        lap_buffer.add_sample(laps, sample)
 
-            # Reset for next lap
-            self.current_lap_samples[car_index] = [sample]
-            self.last_lap_count[car_index] = laps
+        # Queue real-time sample for live visualization
+        self.batcher.add(sample, sample["t"])
     
     def _emit_live_data(self, car_update: Dict[str, Any]):
         """Emit live telemetry data for UI"""
-        live_data = {
-            "current_lap": car_update.get("laps", 0) + 1,
-            "speed": car_update.get("kmh", 0),
-            "gear": car_update.get("gear", 0),
-            "rpm": 0,  # Not available
-            "fuel": 0,  # Would need physics data
-            "position": car_update.get("position", 0),
-            "is_in_pit": 0,  # Would need to detect from data
-            "current_time": "",
-            "last_time": self._format_lap_time(car_update.get("last_lap_ms", 0)),
-            "best_time": self._format_lap_time(car_update.get("best_session_lap_ms", 0)),
-        }
+        live_data = format_live_data(
+            current_lap=car_update.get("laps", 0) + 1,
+            speed=car_update.get("kmh", 0),
+            gear=self._sample_gear(car_update.get("gear", 0)),
+            rpm=0,  # Not available
+            fuel=0,  # Would need physics data
+            position=car_update.get("position", 0),
+            is_in_pit=False,  # Would need to detect from data
+            last_time=self._format_lap_time(car_update.get("last_lap_ms", 0)),
+            best_time=self._format_lap_time(car_update.get("best_session_lap_ms", 0)),
+        )
         self.live_data_update.emit(live_data)
     
+    @staticmethod
+    def _sample_gear(gear: int) -> int:
+        """
+        Parsed car update gear -> SAMPLE_DTYPE convention (-1=R, 0=N, 1=1st, ...).
+        Read with the same mapping as AC's raw gear (0=R, 1=N, 2=1st), as the
+        dashboard always has.
+        """
+        return gear - 1
+
     def _format_lap_time(self, ms: int) -> str:
         """Format milliseconds to lap time string"""
         if ms == 0 or ms > 2147483647:  # Max int, means no time
@@ -1,5 +1,12 @@
 # telemetry/lap_buffer.py
-from typing import List, Dict, Any, Callable
+import logging
+from typing import Callable
+
+import numpy as np
+
+from .samples import SAMPLE_DTYPE
+
+log = logging.getLogger(__name__)
 
 
 class LapBuffer:
@@ -7,60 +14,67 @@ class LapBuffer:
     Buffers telemetry samples for the current lap.
     When completedLaps increments, it calls a callback with the finished lap.
 
+    Samples are SAMPLE_DTYPE records written into a preallocated array
+    (capacity doubles when a lap runs long), so the 60 Hz path does not
+    allocate per sample. Two arrays are used in turn: a finished lap is
+    handed over as-is while the next lap fills the other one.
+
     The callback receives:
       - lap_id: int
-      - samples: List[Dict[str, Any]]
+      - samples: SAMPLE_DTYPE ndarray, a view that stays valid until the
+        following lap completes (copy it to keep it longer)
     """
 
-    def __init__(self, on_lap_complete: Callable[[int, List[Dict[str, Any]]], None]):
+    def __init__(self, on_lap_complete: Callable[[int, np.ndarray], None], capacity: int = 8192):
         self.on_lap_complete = on_lap_complete
         self.current_lap_id: int | None = None
-        self.samples: List[Dict[str, Any]] = []
+        self._pool = [np.empty(capacity, dtype=SAMPLE_DTYPE) for _ in range(2)]
+        self._active = 0
+        self.buf = self._pool[0]
+        self.n = 0
 
-    def add_sample(
-        self,
-        lap_id: int,
-        t: float,
-        x: float,
-        z: float,
-        speed_kmh: float,
-        **extra: Any,
-    ) -> None:
+    def add_sample(self, lap_id: int, sample: np.void) -> None:
         """
-        Add one sample. If lap_id changes (increments), finish previous lap.
-
-        Each sample is stored as a dict:
-          {"t": t, "x": x, "z": z, "speed": speed_kmh, ...extra}
+        Add one SAMPLE_DTYPE record. If lap_id changes (increments), finish previous lap.
         """
+        # Fast path (every frame but the first of a lap): same lap, room left
+        n = self.n
+        if lap_id == self.current_lap_id and n < len(self.buf):
+            self.buf[n] = sample
+            self.n = n + 1
+            return
+        self._add_sample_slow(lap_id, sample)
+
+    def _add_sample_slow(self, lap_id: int, sample: np.void) -> None:
+        """add_sample for the rare cases: first sample, lap change, full buffer."""
 
         # First ever sample
         if self.current_lap_id is None:
             self.current_lap_id = lap_id
 
-        # Same lap as current: just append
-        if lap_id == self.current_lap_id:
-            self.samples.append(
-                {"t": t, "x": x, "z": z, "speed": speed_kmh, **extra}
-            )
-            return
-
-        # New lap started (lap_id > current_lap_id)
-        if lap_id > self.current_lap_id:
-            # Finish previous lap
-            if self.samples:
-                self.on_lap_complete(self.current_lap_id, self.samples)
+        if lap_id != self.current_lap_id:
+            if lap_id > self.current_lap_id:
+                # New lap started: finish previous lap, keep filling the other buffer
+                if self.n:
+                    finished = self.buf[:self.n]
+                    self._active ^= 1
+                    self.buf = self._pool[self._active]
+                    self.on_lap_complete(self.current_lap_id, finished)
+            else:
+                # Lap counter went backwards: probably replay/time-reset
+                log.info("[LapBuffer] Lap counter went backwards, resetting buffer.")
 
             # Start collecting a new lap
             self.current_lap_id = lap_id
-            self.samples = [
-                {"t": t, "x": x, "z": z, "speed": speed_kmh, **extra}
-            ]
-            return
+            self.n = 0
 
-        # If lap_id < current_lap_id, it's probably replay/time-reset; reset buffer
-        if lap_id < self.current_lap_id:
-            print("[LapBuffer] Lap counter went backwards, resetting buffer.")
-            self.current_lap_id = lap_id
-            self.samples = [
-                {"t": t, "x": x, "z": z, "speed": speed_kmh, **extra}
-            ]
+        if self.n == len(self.buf):
+            self._grow()
+        self.buf[self.n] = sample
+        self.n += 1
+
+    def _grow(self) -> None:
+        """Double capacity, keeping the samples collected so far."""
+        buf = np.empty(2 * len(self.buf), dtype=SAMPLE_DTYPE)
+        buf[:self.n] = self.buf[:self.n]
+        self.buf = self._pool[self._active] = buf
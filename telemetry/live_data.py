@@ -0,0 +1,42 @@
+# telemetry/live_data.py
+from typing import Dict
+
+
+# Display strings indexed by gear + 1 (reverse, neutral, 1st..9th)
+_GEAR_STR = ("R", "N") + tuple(str(i) for i in range(1, 10))
+
+
+def format_gear(gear: int) -> str:
+    """Gear in SAMPLE_DTYPE convention (-1=R, 0=N, 1=1st, ...) -> display string."""
+    i = gear + 1
+    return _GEAR_STR[i] if 0 <= i < len(_GEAR_STR) else "?"
+
+
+def format_live_data(
+    current_lap: int,
+    speed: float,
+    gear: int,
+    rpm: int,
+    fuel: float,
+    position: int,
+    is_in_pit: bool,
+    last_time: str = "",
+    best_time: str = "",
+) -> Dict[str, str]:
+    """
+    Build the label texts for the dashboard's live data panel.
+    Called in the backend thread so the UI thread only has to setText().
+
+    Returns a dict keyed lap/position/status/speed/gear/rpm/fuel/last/best.
+    """
+    return {
+        "lap": f"Lap: {current_lap}",
+        "position": f"Position: P{position}",
+        "status": f"Status: {'🏁 IN PIT' if is_in_pit else '🏎️ ON TRACK'}",
+        "speed": f"Speed: {speed:.1f} km/h",
+        "gear": f"Gear: {format_gear(gear)}",
+        "rpm": f"RPM: {rpm:,}",
+        "fuel": f"Fuel: {fuel:.1f} L",
+        "last": f"Last: {last_time if last_time else '--:--:---'}",
+        "best": f"Best: {best_time if best_time else '--:--:---'}",
+    }
@@ -0,0 +1,127 @@
+# telemetry/samples.py
+from collections import deque
+from typing import Callable, List, Optional, Sequence
+
+import numpy as np
+
+
+# One telemetry sample as a fixed-layout record, shared by all backends and the UI.
+# Field access (sample["speed"]) is a fixed-offset load instead of a dict lookup.
+SAMPLE_DTYPE = np.dtype([
+    ("lap_id", np.int32),
+    ("t", np.float64),          # backend clock in seconds (not lap-relative)
+    ("x", np.float32),
+    ("z", np.float32),
+    ("speed", np.float32),      # km/h
+    ("gear", np.int8),          # -1=R, 0=N, 1=1st, ...
+    ("rpms", np.uint16),        # 0 - 65535
+    ("brake", np.float32),      # 0.0 - 1.0
+    ("throttle", np.float32),   # 0.0 - 1.0
+    ("tyre_pressure_fl", np.float32),
+    ("tyre_pressure_fr", np.float32),
+    ("tyre_pressure_rl", np.float32),
+    ("tyre_pressure_rr", np.float32),
+    ("tyre_temp_fl", np.float32),
+    ("tyre_temp_fr", np.float32),
+    ("tyre_temp_rl", np.float32),
+    ("tyre_temp_rr", np.float32),
+])
+
+_NO_TYRE_DATA = (0.0, 0.0, 0.0, 0.0)
+
+
+def make_sample(
+    lap_id: int,
+    t: float,
+    x: float,
+    z: float,
+    speed: float,
+    gear: int = 0,
+    rpms: int = 0,
+    brake: float = 0.0,
+    throttle: float = 0.0,
+    tyre_pressure: Sequence[float] = _NO_TYRE_DATA,
+    tyre_temp: Sequence[float] = _NO_TYRE_DATA,
+    out: Optional[np.ndarray] = None,
+) -> np.void:
+    """
+    Build one SAMPLE_DTYPE record.
+    tyre_pressure / tyre_temp are 4 values ordered FL, FR, RL, RR.
+
+    Pass `out` (a 0-d SAMPLE_DTYPE array from `np.empty((), SAMPLE_DTYPE)`)
+    to overwrite and return it instead of allocating a new record; fine for
+    the buffers here, which copy the record when it is added.
+
+    gear and rpms are clamped to their field ranges: NumPy raises on an
+    out-of-range int, and one bad frame must not stop a worker loop.
+    """
+    gear = min(max(gear, -128), 127)
+    rpms = min(max(rpms, 0), 0xFFFF)
+    values = (lap_id, t, x, z, speed, gear, rpms, brake, throttle, *tyre_pressure, *tyre_temp)
+    if out is not None:
+        out[()] = values
+        return out
+    return np.array(values, dtype=SAMPLE_DTYPE)[()]
+
+
+class SampleBatcher:
+    """
+    Collects SAMPLE_DTYPE records into a preallocated buffer and passes them
+    on in batches (one call per `max_age` seconds or `max_size` samples).
+    The workers hand batches to a SampleRing (`emit=ring.put`), so the GUI
+    drains ~20 batches per second instead of handling every frame.
+
+    The emit callback receives a SAMPLE_DTYPE ndarray it may keep.
+    """
+
+    def __init__(self, emit: Callable[[np.ndarray], None], max_size: int = 16, max_age: float = 0.05):
+        self.emit = emit
+        self.max_age = max_age
+        self._buf = np.empty(max_size, dtype=SAMPLE_DTYPE)
+        self._n = 0
+        self._first_time = 0.0
+
+    def add(self, sample: np.void, now: float) -> None:
+        """Add one record; `now` is the caller's clock in seconds."""
+        n = self._n
+        if n == 0:
+            self._first_time = now
+        self._buf[n] = sample
+        self._n = n + 1
+        if self._n == len(self._buf) or now - self._first_time >= self.max_age:
+            self.flush()
+
+    def flush(self) -> None:
+        """Emit whatever is buffered (no-op when empty)."""
+        if self._n:
+            batch = self._buf[:self._n].copy()
+            self._n = 0
+            self.emit(batch)
+
+
+class SampleRing:
+    """
+    Bounded hand-off of sample batches from a worker thread to the GUI.
+    The worker `put`s batches (e.g. as a SampleBatcher's emit callback) and
+    the GUI `drain`s them on its own timer. When the GUI falls behind, the
+    oldest batches are dropped instead of piling up in Qt's event queue.
+
+    deque append/popleft are atomic, so no lock is needed for one producer
+    and one consumer.
+    """
+
+    def __init__(self, max_batches: int = 80):  # ~4 s of 50 ms batches
+        self._batches = deque(maxlen=max_batches)
+
+    def put(self, batch: np.ndarray) -> None:
+        self._batches.append(batch)
+
+    def drain(self) -> List[np.ndarray]:
+        """Remove and return all queued batches, oldest first."""
+        batches = []
+        popleft = self._batches.popleft
+        while True:
+            try:
+                batches.append(popleft())
+            except IndexError:
+                return batches